@@ -3,8 +3,14 @@
 # We generate it offline then keep the statically generated file to reduce startup time
 # @see https://github.com/biocommons/hgvs/issues/661
 
+# Run with --compile to also rebuild the optional Cython extension for the
+# generated module (see setup.py); otherwise any previously compiled extension
+# is removed so that it cannot shadow the regenerated Python code.
+
+import glob
 import hashlib
 import os
+import subprocess
 import sys
 
 import parsley
@@ -52,3 +58,12 @@ if __name__ == "__main__":
     with open(source_filename, "w") as source_file:
         source_file.write(header + "\n")
         source_file.write(source)
+
+    # compiled extensions are imported in preference to hgvs_grammar.py
+    for pattern in ("hgvs_grammar.c", "hgvs_grammar.*.so", "hgvs_grammar.*.pyd"):
+        for ext_filename in glob.glob(os.path.join(generated_code_dir, pattern)):
+            os.remove(ext_filename)
+    if "--compile" in sys.argv[1:]:
+        env = dict(os.environ, HGVS_FAST_GRAMMAR="1")
+        subprocess.check_call([sys.executable, "setup.py", "build_ext", "--inplace"],
+                              cwd=hgvs_base_dir, env=env)
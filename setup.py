@@ -1,2 +1,17 @@
+import os
+
 from setuptools import setup
-setup(use_scm_version=True)
+
+ext_modules = []
+if os.environ.get("HGVS_FAST_GRAMMAR") == "1":
+    # Optionally compile the generated grammar to a C extension, which is
+    # imported in preference to hgvs_grammar.py.  The .py file remains
+    # the canonical source; requires Cython in the build environment.
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        "src/hgvs/generated/hgvs_grammar.py",
+        compiler_directives={"language_level": 3},
+    )
+
+setup(use_scm_version=True, ext_modules=ext_modules)
@@ -33,7 +33,19 @@ class HGVSNormalizationError(HGVSError):
 
 
 class HGVSParseError(HGVSError):
-    pass
+    """Exception raised when a string cannot be parsed
+
+    When raised by the parser, `char_pos` and `reason` hold the
+    position and reason of the failure within `input`; they are None
+    otherwise.
+
+    """
+
+    def __init__(self, *args, char_pos=None, reason=None, input=None):
+        super(HGVSParseError, self).__init__(*args)
+        self.char_pos = char_pos
+        self.reason = reason
+        self.input = input
 
 
 class HGVSUnsupportedOperationError(HGVSError):
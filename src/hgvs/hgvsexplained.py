@@ -2,6 +2,8 @@
 
 """
 
+import sys
+
 class HGVSExplained(object):
     """Represents ...
 
@@ -9,6 +11,8 @@ class HGVSExplained(object):
 
     """
 
+    __slots__ = ("orig_var_string", "hgvs_obj", "hgvs_parser_exc", "hgvs_error_type", "parse_explain")
+
     def __init__(self, *, orig_var_string, hgvs_obj=None, hgvs_parser_exc=None, hgvs_error_type=None ):
         self.orig_var_string = orig_var_string
         self.hgvs_obj = hgvs_obj
@@ -23,19 +27,21 @@ class HGVSExplained(object):
         #   if attempt rescue, then parse_explain also will be populated
 
     def add_explained(self, *expl_list):
-        for e in expl_list:
-            assert( isinstance(e, HGVSExplained) )
-            self.parse_explain.append(e)
+        # expl_list contains HGVSExplained objects; not checked here
+        # because this is called for every node of an explanation tree
+        self.parse_explain.extend(expl_list)
 
     def pprint(self, indent_step=4, current_indent=0):
-        obj_type = 'HGVSExplained object'
-        if( self.hgvs_obj ):
-            obj_type = 'HGVS object'
-        
-        s = "[{v}] => [{obj_type}]".format(v=self.orig_var_string, obj_type=obj_type)
-        indent_str = ' ' * current_indent
-        print( "{i}{s}".format(i=indent_str, s=s) )
-
-        for item in self.parse_explain:
-            item.pprint( indent_step, current_indent + indent_step )
-
+        lines = []
+        stack = [(self, current_indent)]
+        while stack:
+            node, indent = stack.pop()
+            obj_type = 'HGVSExplained object'
+            if( node.hgvs_obj ):
+                obj_type = 'HGVS object'
+            lines.append("{i}[{v}] => [{obj_type}]".format(i=' ' * indent, v=node.orig_var_string, obj_type=obj_type))
+            # reversed, so that children are emitted in order
+            for item in reversed(node.parse_explain):
+                stack.append((item, indent + indent_step))
+
+        sys.stdout.write("\n".join(lines) + "\n")
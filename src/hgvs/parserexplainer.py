@@ -10,6 +10,19 @@ from hgvs.hgvsexplained import HGVSExplained
 import logging
 from hgvs.exceptions import HGVSParseError
 
+_logger = logging.getLogger(__name__)
+
+# anchored on the "p." token; (?=(X))\N emulates an atomic group so the
+# residue/position/residue matches cannot backtrack into one another
+_P_DOT_RE = re.compile(r"p\.(?=([A-Za-z]{1,3}))\1(\d+)(?=([A-Za-z]{1,3}))\3", re.IGNORECASE)
+_ONE_OF_RE = re.compile(r"one of .+ or a digit$")
+_NM_NP_RE = re.compile(r"^(NM[^,]+), (NP.+)")
+_RESIDUE_RE = re.compile(r"'c', 'g', 'm', 'n', 'p', or 'r")
+
+# rescue splits recurse into parse_hgvs_variant_explain_wrapped(); chunks nested
+# deeper than this are returned unexplained
+_MAX_EXPLAIN_DEPTH = 3
+
 class ParserExplainer(object):
     """Provides ...
 
@@ -22,36 +35,64 @@ class ParserExplainer(object):
     def __init__(self, hgvs_parser):
         self._hgvs_parser = hgvs_parser
 
-    def parse_hgvs_variant_explain( self, v ):
+    def parse_hgvs_variant_explain( self, v, _depth=0 ):
         """parse HGVS variant `v`, with explanation (return type varies by result)
 
+        Returns the SequenceVariant when `v` parses; only failures are
+        boxed into an HGVSExplained.
+
         :param str v: an HGVS-formatted variant as a string
+        :rtype: SequenceVariant or HGVSExplained
 
         """
-        self._orig_var_string = v
+        try:
+            return self._hgvs_parser.parse_hgvs_variant(v)
+        except HGVSParseError as exc:
+            return self.explain_failure(v, exc, _depth)
 
+    def parse_hgvs_variant_explain_wrapped( self, v, _depth=0 ):
+        """parse HGVS variant `v`, with explanation, always returning an HGVSExplained
+
+        :param str v: an HGVS-formatted variant as a string
+        :rtype: HGVSExplained
+
+        """
+        if _depth > _MAX_EXPLAIN_DEPTH:
+            _logger.info("not explaining [%s]: exceeded depth %d", v, _MAX_EXPLAIN_DEPTH)
+            return HGVSExplained( orig_var_string=v, hgvs_error_type='max recursion' )
         try:
-            logging.info("trying to parse [{v}]".format(v=v))
+            _logger.info("trying to parse [%s]", v)
             hgvs = self._hgvs_parser.parse_hgvs_variant(v)
-            logging.info("got a {t} object and putting it in hgvs_obj".format(t=type(hgvs)))
+            _logger.info("got a %s object and putting it in hgvs_obj", type(hgvs))
             return HGVSExplained( orig_var_string=v, hgvs_obj=hgvs )
         except HGVSParseError as exc:
-            logging.info("HGVS parsing failed, calling _explain()")
-            hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='TBD' )
-            expl_list = self._explain(v, exc) # this should return a list of HGVSExplained objects
-            logging.info("got results from explaining [{v}], [{n}] elements in list".format(v=v, n=len(expl_list)))
-            hgvs_e.add_explained( *expl_list )
-            return hgvs_e
-
-    # handles exc, chunk-ifies, calls parse_hgvs_variant_explain() on chunks, returns list of HGVSExplained objects
-    def _explain(self, v, exc):
-        match = re.search( "char (\d+): expected (.+)$", exc.args[0] )
-
-        if( not match ):
+            return self.explain_failure(v, exc, _depth)
+
+    def explain_failure(self, v, exc, _depth=0):
+        """explain why HGVS variant `v` failed to parse with `exc`
+
+        :param str v: the HGVS-formatted variant that failed to parse
+        :param HGVSParseError exc: the exception raised by the parser for `v`
+        :rtype: HGVSExplained
+
+        """
+        self._orig_var_string = v
+        _logger.info("HGVS parsing failed, calling _explain()")
+        hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='TBD' )
+        expl_list = self._explain(v, exc, _depth) # this should return a list of HGVSExplained objects
+        _logger.info("got results from explaining [%s], [%d] elements in list", v, len(expl_list))
+        hgvs_e.add_explained( *expl_list )
+        return hgvs_e
+
+    # handles exc, chunk-ifies, calls parse_hgvs_variant_explain_wrapped() on chunks, returns list of HGVSExplained objects
+    def _explain(self, v, exc, _depth=0):
+        # Parser attaches the failure position and reason to the exception
+        char_pos, reason = exc.char_pos, exc.reason
+
+        if( char_pos is None or not reason.startswith("expected ") ):
             self.raise_exc(v, exc)
 
-        char_pos = int(match.group(1))
-        expected_str = match.group(2)
+        expected_str = reason[len("expected "):].rstrip()
     
         if(expected_str == "EOF" ):
             # This error is generated when the first part of an expression is valid but the string
@@ -60,39 +101,40 @@ class ParserExplainer(object):
             # to be a valid HGVS expression, while the latter portion is unlikely to be valid.
             part1, part2 = v[:char_pos], v[char_pos+1:]
             part2 = part2.strip()
-            print( "got an EOF, creating [{part1}], [{part2}]".format(part1=part1, part2=part2))
+            _logger.debug("got an EOF, creating [%s], [%s]", part1, part2)
 
             # try to parse each half separately
             results = []
             for part in ( part1, part2):
-                result_obj = self.parse_hgvs_variant_explain( part )
+                if not part.strip():
+                    continue
+                result_obj = self.parse_hgvs_variant_explain_wrapped( part, _depth + 1 )
                 results.append(result_obj)
 
             return results
 
         elif( expected_str == "a digit" ):
             # checking for 'p.' and '{AA}{\d+}{AA}'
-            m = re.search( "p\..*([a-zA-Z][a-zA-Z]{2}?)(\d+)([a-zA-Z][a-zA-Z]{2}?)", exc.args[0], flags=re.IGNORECASE )
+            m = _P_DOT_RE.search( exc.input )
             if( m ):
-                logging.info("chunk [{v}] looks like a p. string: [p.][{g1}][{g2}][{g3}]".format(v=v, g1=m.group(1), g2=m.group(2), g3=m.group(3) ) )
+                _logger.info("chunk [%s] looks like a p. string: [p.][%s][%s][%s]", v, m.group(1), m.group(2), m.group(3))
 
             hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='looks like a p.')
 
             return [ hgvs_e ]
         
-        elif re.search("one of .+ or a digit$", expected_str):
-            logging.error("'{l}' is not a valid character. Invalid character at position {c} in string {v}.".format(c=char_pos, v=v, l = v[char_pos]))
-            
-            c_variant_p_variant = r"^(NM[^,]+), (NP.+)"
-            if m := re.search(c_variant_p_variant, v):
+        elif _ONE_OF_RE.search(expected_str):
+            _logger.error("'%s' is not a valid character. Invalid character at position %d in string %s.", v[char_pos], char_pos, v)
+
+            if m := _NM_NP_RE.search(v):
                 coding = m.group(1)
                 protein = m.group(2)
-                logging.info("Received two groups [{c}, {p}] but expecting input only expected one.".format(c=coding, p = protein))
+                _logger.info("Received two groups [%s, %s] but expecting input only expected one.", coding, protein)
 
                 # try to parse each half separately
                 results = []
                 for part in ( coding, protein):
-                    result_obj = self.parse_hgvs_variant_explain( part )
+                    result_obj = self.parse_hgvs_variant_explain_wrapped( part, _depth + 1 )
                     results.append(result_obj)
 
                 return results
@@ -100,15 +142,22 @@ class ParserExplainer(object):
             
             return [ hgvs_e ]
         
-        elif re.search("'c', 'g', 'm', 'n', 'p', or 'r", exc):
+        elif _RESIDUE_RE.search(expected_str):
             self.log_invalid_hgvs()
 
+            hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='missing or invalid residue type')
+
+            return [ hgvs_e ]
+
         elif char_pos == 1:
             self.log_invalid_start_char()
 
-            
+            hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='invalid start char')
+
+            return [ hgvs_e ]
+
         else:
-            logging.info("got [{v}], expected [{s}]".format(v=v, s=expected_str) )
+            _logger.info("got [%s], expected [%s]", v, expected_str)
 
             hgvs_e = HGVSExplained( orig_var_string=v, hgvs_parser_exc=exc, hgvs_error_type='expected {s}'.format(s=expected_str))
             
@@ -116,10 +165,10 @@ class ParserExplainer(object):
     
     def raise_exc(self, v, exc) -> Exception:
         msg = "[{v}] bombed, cannot handle this error yet: {exc}".format(v=v, exc=exc)
-        raise exc( msg )
+        raise HGVSParseError(msg) from exc
     
     def log_invalid_hgvs(self):
-        logging.error("Invalid HGVS pattern (missing ResidueType). Expected syntax: ReferenceSequence:ResidueType.Interval. Example: NM_000097.7:c.814A>C")
+        _logger.error("Invalid HGVS pattern (missing ResidueType). Expected syntax: ReferenceSequence:ResidueType.Interval. Example: NM_000097.7:c.814A>C")
     
     def log_invalid_start_char(self, char_pos=1):
-        logging.error("Invalid character at position {c}. Possibly missing RefSeq. Expected syntax: NM_000097.7:c.814A>C".format(c = char_pos))
+        _logger.error("Invalid character at position %d. Possibly missing RefSeq. Expected syntax: NM_000097.7:c.814A>C", char_pos)
@@ -1,16 +1,49 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import concurrent.futures
+import functools
 import hashlib
+import mmap
 import os
-import pprint
 import re
-import unittest
+import sys
+import types
+from pathlib import Path
 
 import pytest
 
+import hgvs.generated.hgvs_grammar
 import hgvs.parser
 from hgvs.exceptions import HGVSParseError
+from hgvs.hgvsexplained import HGVSExplained
+from hgvs.parserexplainer import ParserExplainer
+
+# format config for roundtrip checks; read-only because it is shared
+_FMT_CONF = types.MappingProxyType({"max_ref_length": None})
+
+
+def _roundtrip_failure_message(v):
+    import pprint  # only needed when a roundtrip fails
+
+    return "parse-format roundtrip failed:" + pprint.pformat(v.posedit)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_corpus(name):
+    """returns tuple of (variant, message) pairs from tests/data/`name`,
+    skipping comments and blank lines; message is "" when absent"""
+    path = Path(__file__).parent / "data" / name
+    if path.stat().st_size == 0:
+        return ()  # empty files cannot be mapped
+    # variants are ASCII; only lines that are kept are decoded
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = (line.strip() for line in iter(mm.readline, b""))
+        return tuple(
+            (var.decode("ascii"), msg.decode("ascii"))
+            for var, _, msg in (line.partition(b"\t") for line in lines)
+            if var and not var.startswith(b"#")
+        )
 
 
 def test_parser_variants_with_gene_names(parser):
@@ -63,96 +96,252 @@ def test_parser_variants_with_no_transcript_gene_names(parser):
         parser.parse("BOGUS/EXCELLENT:c.22+1A>T")  # contains invalid character
 
 
-class Test_Parser(unittest.TestCase):
-    longMessage = True
-
-    @classmethod
-    def setUpClass(cls):
-        cls.parser = hgvs.parser.Parser()
-
-    def test_parser_parse_shorthand(self):
-        v = "NM_01234.5:c.22+1A>T"
-        assert self.parser.parse_hgvs_variant(v) == self.parser.parse(v)
-
-    def test_parser_gauntlet(self):
-        fn = os.path.join(os.path.dirname(__file__), "data", "gauntlet")
-        for var in open(fn, "r"):
-            var = var.strip()
-            if var.startswith("#") or var == "":
-                continue
-            v = self.parser.parse_hgvs_variant(var)
-            self.assertEqual(
-                var,
-                v.format(conf={"max_ref_length": None}),
-                "parse-format roundtrip failed:" + pprint.pformat(v.posedit),
-            )
-
-    @pytest.mark.quick
-    def test_parser_reject(self):
-        fn = os.path.join(os.path.dirname(__file__), "data", "reject")
-        for var in open(fn, "r"):
-            var, msg = var.strip().split("\t")
-            if var.startswith("#") or var == "":
-                continue
-            with self.assertRaises(HGVSParseError):
-                self.parser.parse_hgvs_variant(var)
-                self.assertTrue(False, msg="expected HGVSParseError: %s (%s)" % (var, msg))
-
-    @pytest.mark.quick
-    def test_parser_posedit_special(self):
-        # See note in grammar about parsing p.=, p.?, and p.0
-        self.assertEqual(str(self.parser.parse_p_posedit("0")), "0")
-        self.assertEqual(str(self.parser.parse_p_posedit("0?")), "0?")
-        # self.assertEqual( str(self.parser.parse_p_posedit("(0)")), "0?" )
-
-        self.assertIsNone(self.parser.parse_p_posedit("?"))
-
-        self.assertEqual(str(self.parser.parse_p_posedit("=")), "=")
-        # self.assertEqual( str(self.parser.parse_p_posedit("=?")), "(=)" )
-        self.assertEqual(str(self.parser.parse_p_posedit("(=)")), "(=)")
-
-    @pytest.mark.quick
-    def test_grammar_and_generated_code_in_sync(self):
-        """We generate Python code from the OMeta grammar
-        This test checks that the grammar file hasn't changed since we generated the Python code"""
-
-        script_path = os.path.realpath(__file__)
-        script_dir = os.path.dirname(script_path)
-        hgvs_base_dir = os.path.dirname(script_dir)
-        grammar_filename = "src/hgvs/_data/hgvs.pymeta"
-        generated_filename = "src/hgvs/generated/hgvs_grammar.py"
-
-        # Hash the grammar file
-        with open(os.path.join(hgvs_base_dir, grammar_filename), "rb") as grammar_f:
-            grammar_hash = hashlib.md5(grammar_f.read()).hexdigest()
-
-        # Read the stored grammar file hash from generated file
-        with open(os.path.join(hgvs_base_dir, generated_filename), "r") as generated_f:
-            generated_hash = None
-            for line in generated_f:
-                if not line.startswith("#"):
-                    break
-                m = re.match(r".*Grammar hash: ([a-fA-F0-9]{32})", line)
-                if m:
-                    generated_hash = m.group(1)
-
-            msg = "Could not retrieve generated hash from {generated_hash}".format(
-                generated_hash=generated_hash
+def test_parser_reuse_across_threads(parser):
+    """grammar instances are reused per thread; interleaved parses must not interfere"""
+    variants = ["NM_01234.5:c.22+1A>T", "NP_012345.6:p.Ala22Trp", "NC_000001.10:g.1_2del"]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda v: str(parser.parse(v)), variants * 20))
+    assert results == variants * 20
+
+
+def test_parser_reject_non_letter_start(parser):
+    with pytest.raises(HGVSParseError, match=r"^1NM_01234.5:c.22A>T: char 0: expected a letter$"):
+        parser.parse_hgvs_variant("1NM_01234.5:c.22A>T")
+    # leading whitespace is stripped by the grammar
+    assert str(parser.parse_hgvs_variant("  NM_01234.5:c.22A>T")) == "NM_01234.5:c.22A>T"
+
+
+def test_parser_error_attributes(parser):
+    with pytest.raises(HGVSParseError) as excinfo:
+        parser.parse_hgvs_variant("NM_01234.5:c.22A>T foo")
+    exc = excinfo.value
+    assert (exc.char_pos, exc.reason, exc.input) == (18, "expected EOF", "NM_01234.5:c.22A>T foo")
+    assert str(exc) == "NM_01234.5:c.22A>T foo: char 18: expected EOF"
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "NM_01234.5:c.22+1A>T",
+        "NM_01234.5(BOGUS):c.22+1A>T",
+        "NM_01234.5(BOGUS-EXCELLENT):c.22+1A>",
+        "NM_01234.5(BOGUS-):c.22+1A>T",
+        "ENST00000357654.9:c.22A>T",
+        "NP_012345.6:p.(Ala22Trp)",
+        "NC_000001.10:g.1_2del",
+        "NM_01234.5:c.22+1A>",
+        "NM_01234.5:c. 22A>T",
+    ],
+)
+def test_parser_split_accession_matches_grammar(parser, variant):
+    """parse_hgvs_variant may split off simple accessions; results and
+    errors must match the full grammar rule"""
+    rule_fxn = getattr(parser, "parse_{}_variant".format(variant.split(":")[1][0]))
+    try:
+        expected = rule_fxn(variant)
+    except HGVSParseError as exc:
+        with pytest.raises(HGVSParseError) as excinfo:
+            parser.parse_hgvs_variant(variant)
+        assert str(excinfo.value) == str(exc)
+    else:
+        assert parser.parse_hgvs_variant(variant) == expected
+
+
+@pytest.mark.parametrize(
+    "var",
+    [var for var, _ in _load_corpus("gauntlet")],
+    ids=[sys.intern(var) for var, _ in _load_corpus("gauntlet")],
+)
+def test_parser_gauntlet(parser, var):
+    v = parser.parse_hgvs_variant(var)
+    formatted = v.format(conf=_FMT_CONF)
+    # the assert message is only evaluated on failure
+    assert var == formatted, _roundtrip_failure_message(v)
+
+
+@pytest.mark.quick
+@pytest.mark.parametrize(
+    "var,msg", _load_corpus("reject"), ids=[sys.intern(var) for var, _ in _load_corpus("reject")]
+)
+def test_parser_reject(parser, var, msg):
+    with pytest.raises(HGVSParseError):
+        parser.parse_hgvs_variant(var)
+        pytest.fail("expected HGVSParseError: %s (%s)" % (var, msg))
+
+
+@pytest.fixture(scope="module")
+def restricted_parser(tmp_path_factory):
+    """parser for a copy of the bundled grammar whose hgvs_variant rule
+    accepts no g. variants, whose accessions must start with NM_ and whose
+    gene symbols must start with BRCA"""
+    grammar = (Path(hgvs.parser.__file__).parent / "_data" / "hgvs.pymeta").read_text()
+    rules = {
+        "typed_posedit = 'g':type '.' g_posedit:posedit -> (type, posedit)\n              | ": (
+            "typed_posedit = "
+        ),
+        "accn = <letter ": "accn = <'NM_' ",
+        "gene_symbol = <letter ": "gene_symbol = <'BRCA' ",
+    }
+    for old, new in rules.items():
+        assert old in grammar
+        grammar = grammar.replace(old, new)
+    grammar_fn = tmp_path_factory.mktemp("grammar") / "restricted.pymeta"
+    grammar_fn.write_text(grammar)
+    return hgvs.parser.Parser(grammar_fn=str(grammar_fn))
+
+
+def test_parser_custom_grammar_hgvs_variant(restricted_parser):
+    # per-type dispatch would bypass the custom hgvs_variant rule
+    assert restricted_parser.parse_g_variant("NM_01234.5:g.22A>T")
+    with pytest.raises(HGVSParseError):
+        restricted_parser.parse_hgvs_variant("NM_01234.5:g.22A>T")
+    assert str(restricted_parser.parse_hgvs_variant("NM_01234.5:c.22A>T")) == "NM_01234.5:c.22A>T"
+
+
+def test_parser_custom_grammar_error(restricted_parser):
+    # errors come from the custom grammar, not the bundled grammar's pre-check
+    with pytest.raises(HGVSParseError) as excinfo:
+        restricted_parser.parse_hgvs_variant("1NM_01234.5:c.22A>T")
+    assert excinfo.value.reason == "expected the character 'NM_'"
+
+
+def test_parser_custom_grammar_accession(restricted_parser):
+    # the accession fast path would bypass the custom accn rule
+    with pytest.raises(HGVSParseError):
+        restricted_parser.parse_hgvs_variant("XM_1:c.1A>T")
+    assert str(restricted_parser.parse_hgvs_variant("NM_1:c.1A>T")) == "NM_1:c.1A>T"
+
+
+def test_parser_custom_grammar_gene_symbol(restricted_parser):
+    # the gene symbol fast path would bypass the custom gene_symbol rule
+    with pytest.raises(HGVSParseError):
+        restricted_parser.parse_hgvs_variant("NM_01234.5(BOGUS):c.22A>T")
+    v = restricted_parser.parse_hgvs_variant("NM_01234.5(BRCA1):c.22A>T")
+    assert v.gene == "BRCA1"
+
+
+def test_parser_parse_many(parser):
+    variants = [
+        "NM_01234.5:c.22+1A>T",
+        "BOGUS:c.22+1A>T",
+        "NM_000097.7:c.814A>C, NP_000088.1:p.Arg2Gly",
+        "NP_012345.6:p.A",  # cannot be explained
+        "NM_01234.5:x.22A>T",
+        "NM_01234.5:c.1A>T",
+    ]
+    results = list(parser.parse_many(variants))
+    assert [v for v, _ in results] == variants
+    assert str(results[0][1]) == "NM_01234.5:c.22+1A>T"
+    assert str(results[1][1]) == "BOGUS:c.22+1A>T"
+    assert isinstance(results[2][1], HGVSExplained)
+    assert len(results[2][1].parse_explain) == 2
+    assert isinstance(results[3][1], HGVSParseError)
+    assert isinstance(results[4][1], HGVSExplained)
+    assert str(results[5][1]) == "NM_01234.5:c.1A>T"
+
+    # only unexplainable variants are yielded as errors; other exceptions propagate
+    with pytest.raises(TypeError):
+        list(parser.parse_many([None]))
+
+
+def test_parser_parse_many_explainer_error(parser, monkeypatch):
+    # bugs in the explainer are not turned into results
+    monkeypatch.setattr(ParserExplainer, "_explain", lambda self, v, exc, _depth=0: None)
+    with pytest.raises(TypeError):
+        list(parser.parse_many(["NM_01234.5:x.22A>T"]))
+
+
+def test_parser_cache():
+    parser = hgvs.parser.Parser(cache=True)
+    v1 = parser.parse_hgvs_variant("NM_01234.5:c.22+1A>T")
+    v2 = parser.parse("NM_01234.5:c.22+1A>T")
+    assert v1 == v2
+    assert v1 is not v2 and v1.posedit is not v2.posedit
+    v1.posedit.edit.alt = "G"
+    assert str(parser.parse_hgvs_variant("NM_01234.5:c.22+1A>T")) == "NM_01234.5:c.22+1A>T"
+    assert parser._parse_hgvs_variant_cached.cache_info().hits == 2
+    parser.cache_clear()
+    assert parser._parse_hgvs_variant_cached.cache_info().currsize == 0
+    with pytest.raises(HGVSParseError):
+        parser.parse_hgvs_variant("NM_01234.5:c.22+1A>")
+
+
+def test_parser_parse_shorthand(parser):
+    v = "NM_01234.5:c.22+1A>T"
+    assert parser.parse_hgvs_variant(v) == parser.parse(v)
+
+
+@pytest.mark.quick
+def test_parser_posedit_special(parser):
+    # See note in grammar about parsing p.=, p.?, and p.0
+    assert str(parser.parse_p_posedit("0")) == "0"
+    assert str(parser.parse_p_posedit("0?")) == "0?"
+    # assert str(parser.parse_p_posedit("(0)")) == "0?"
+
+    assert parser.parse_p_posedit("?") is None
+
+    assert str(parser.parse_p_posedit("=")) == "="
+    # assert str(parser.parse_p_posedit("=?")) == "(=)"
+    assert str(parser.parse_p_posedit("(=)")) == "(=)"
+
+
+@pytest.mark.quick
+def test_grammar_and_generated_code_in_sync():
+    """We generate Python code from the OMeta grammar
+    This test checks that the grammar file hasn't changed since we generated the Python code"""
+
+    script_path = os.path.realpath(__file__)
+    script_dir = os.path.dirname(script_path)
+    hgvs_base_dir = os.path.dirname(script_dir)
+    grammar_filename = "src/hgvs/_data/hgvs.pymeta"
+    generated_filename = "src/hgvs/generated/hgvs_grammar.py"
+
+    if not os.path.exists(os.path.join(hgvs_base_dir, grammar_filename)):
+        pytest.skip("grammar source not available in installed mode")
+
+    # Hash the grammar file
+    with open(os.path.join(hgvs_base_dir, grammar_filename), "rb") as grammar_f:
+        grammar_hash = hashlib.md5(grammar_f.read()).hexdigest()
+
+    # Read the stored grammar file hash from generated file
+    with open(os.path.join(hgvs_base_dir, generated_filename), "r") as generated_f:
+        generated_hash = None
+        for line in generated_f:
+            if not line.startswith("#"):
+                break
+            m = re.match(r".*Grammar hash: ([a-fA-F0-9]{32})", line)
+            if m:
+                generated_hash = m.group(1)
+
+    # messages are only formatted on failure
+    if generated_hash is None:
+        pytest.fail(
+            "Could not retrieve generated hash from {generated_filename}".format(
+                generated_filename=generated_filename
             )
-            self.assertIsNotNone(generated_hash, msg)
-
-        msg = (
+        )
+    if generated_hash != grammar_hash:
+        pytest.fail(
             "OMeta source '{grammar_filename}' is different than the version used to generate "
             "Python code '{generated_filename}'. You need to run "
             "'sbin/generate_parser.py' ".format(
                 grammar_filename=grammar_filename, generated_filename=generated_filename
             )
         )
-        self.assertEqual(generated_hash, grammar_hash, msg)
 
+    # an optional compiled extension (HGVS_FAST_GRAMMAR) is imported in
+    # preference to the generated Python code; it must not be stale
+    compiled_filename = hgvs.generated.hgvs_grammar.__file__
+    if not compiled_filename.endswith(".py"):
+        generated_mtime = os.stat(os.path.join(hgvs_base_dir, generated_filename)).st_mtime
+        if os.stat(compiled_filename).st_mtime < generated_mtime:
+            pytest.fail(
+                "Compiled grammar '{compiled_filename}' is older than '{generated_filename}'. "
+                "You need to run 'sbin/generate_parser.py --compile'".format(
+                    compiled_filename=compiled_filename, generated_filename=generated_filename
+                )
+            )
 
-if __name__ == "__main__":
-    unittest.main()
 
 # <LICENSE>
 # Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
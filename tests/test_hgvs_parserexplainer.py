@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+import hgvs.sequencevariant
+from hgvs.exceptions import HGVSParseError
+from hgvs.hgvsexplained import HGVSExplained
+from hgvs.parserexplainer import ParserExplainer
+
+
+@pytest.mark.quick
+def test_explain_valid_variant_returns_sequencevariant(parser):
+    v = parser.parse("NM_01234.5:c.22+1A>T", explain=True)
+    assert isinstance(v, hgvs.sequencevariant.SequenceVariant)
+
+
+@pytest.mark.quick
+def test_explain_wrapped_valid_variant(parser):
+    e = ParserExplainer(parser).parse_hgvs_variant_explain_wrapped("NM_01234.5:c.22+1A>T")
+    assert isinstance(e, HGVSExplained)
+    assert str(e.hgvs_obj) == "NM_01234.5:c.22+1A>T"
+
+
+@pytest.mark.quick
+def test_explain_two_variants(parser):
+    e = parser.parse("NM_000097.7:c.814A>C, NP_000088.1:p.Arg2Gly", explain=True)
+    assert isinstance(e, HGVSExplained)
+    assert e.hgvs_obj is None
+    assert [str(c.hgvs_obj) for c in e.parse_explain] == [
+        "NM_000097.7:c.814A>C",
+        "NP_000088.1:p.Arg2Gly",
+    ]
+
+
+@pytest.mark.quick
+def test_explain_max_recursion(parser):
+    v = ", ".join("NM_000097.7:c.{}A>C".format(i) for i in range(1, 8))
+    e = parser.parse(v, explain=True)
+    for _ in range(4):
+        e = e.parse_explain[-1]
+    assert e.hgvs_error_type == "max recursion"
+    assert e.parse_explain == []
+
+
+@pytest.mark.quick
+@pytest.mark.parametrize("v", ["NM_01234.5:x.22A>T", "NM_01234.5:22A>T"])
+def test_explain_invalid_residue_type(parser, v):
+    e = parser.parse(v, explain=True)
+    assert [c.hgvs_error_type for c in e.parse_explain] == ["missing or invalid residue type"]
+
+
+@pytest.mark.quick
+def test_explain_invalid_start_char(parser):
+    e = parser.parse("N)", explain=True)
+    assert [c.hgvs_error_type for c in e.parse_explain] == ["invalid start char"]
+
+
+@pytest.mark.quick
+def test_explain_unhandled_error(parser):
+    with pytest.raises(HGVSParseError, match="cannot handle this error yet") as excinfo:
+        parser.parse("NP_012345.6:p.A", explain=True)
+    assert isinstance(excinfo.value.__cause__, HGVSParseError)
+
+
+@pytest.mark.quick
+def test_explained_pprint(capsys):
+    root = HGVSExplained(orig_var_string="a")
+    child = HGVSExplained(orig_var_string="b")
+    child.add_explained(HGVSExplained(orig_var_string="c"))
+    root.add_explained(child, HGVSExplained(orig_var_string="d", hgvs_obj="d"))
+    root.pprint()
+    assert capsys.readouterr().out == (
+        "[a] => [HGVSExplained object]\n"
+        "    [b] => [HGVSExplained object]\n"
+        "        [c] => [HGVSExplained object]\n"
+        "    [d] => [HGVS object]\n"
+    )
+
+
+# <LICENSE>
+# Copyright 2018 HGVS Contributors (https://github.com/biocommons/hgvs)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# </LICENSE>